@@ -5,6 +5,8 @@ import dotenv # type: ignore
 
 dotenv.load_dotenv()
 
+AI_MODEL = "cognitivecomputations/dolphin3.0-r1-mistral-24b:free"
+
 def get_ai_response(prompt):
     key = os.getenv("OPENAI_API_KEY")
     response = requests.post(
@@ -13,7 +15,7 @@ def get_ai_response(prompt):
         "Authorization": "Bearer " + key,
     },
     data=json.dumps({
-        "model": "cognitivecomputations/dolphin3.0-r1-mistral-24b:free", # Optional
+        "model": AI_MODEL, # Optional
         "messages": [
         {
             "role": "user",
@@ -0,0 +1,125 @@
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+
+class RecommendationCache:
+    """
+    On-disk cache of AI recommendations keyed by a fingerprint of the prompt inputs.
+
+    Entries are evicted least-recently-used once max_entries is exceeded and
+    expire after ttl_seconds. Hit and miss counts are persisted alongside the
+    entries so the hit rate survives app restarts.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_entries: int = 1000, ttl_seconds: int = 7 * 24 * 3600):
+        self.path = path or os.getenv('RECOMMENDATION_CACHE_PATH', '.cache/recommendations.sqlite3')
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS recommendations (
+                    fingerprint TEXT PRIMARY KEY,
+                    content TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE TABLE IF NOT EXISTS stats (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+            conn.execute("INSERT OR IGNORE INTO stats (name, value) VALUES ('hits', 0), ('misses', 0)")
+
+    @contextmanager
+    def _connect(self):
+        """Open a connection per operation so the cache can be shared across threads"""
+        conn = sqlite3.connect(self.path, timeout=5)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def fingerprint(prompt_inputs: Dict) -> str:
+        """Return a stable hash of canonicalised prompt inputs"""
+        canonical = json.dumps(prompt_inputs, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    def get(self, fingerprint: str) -> Optional[str]:
+        """Return the cached recommendation for a fingerprint, or None on a miss"""
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT content, created_at FROM recommendations WHERE fingerprint = ?",
+                (fingerprint,)
+            ).fetchone()
+
+            if row and now - row[1] > self.ttl_seconds:
+                conn.execute("DELETE FROM recommendations WHERE fingerprint = ?", (fingerprint,))
+                row = None
+
+            if row:
+                conn.execute("UPDATE recommendations SET accessed_at = ? WHERE fingerprint = ?", (now, fingerprint))
+            conn.execute("UPDATE stats SET value = value + 1 WHERE name = ?", ('hits' if row else 'misses',))
+
+            # Log the running hit rate from the same connection rather than a separate stats() call
+            counts = dict(conn.execute("SELECT name, value FROM stats").fetchall())
+            lookups = counts['hits'] + counts['misses']
+            print(f"Recommendation cache {'hit' if row else 'miss'} "
+                  f"(hit rate {counts['hits'] / lookups:.0%} over {lookups} lookups)")
+
+            return row[0] if row else None
+
+    def set(self, fingerprint: str, content: str) -> None:
+        """Store a recommendation and evict expired and least recently used entries"""
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO recommendations (fingerprint, content, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (fingerprint, content, now, now)
+            )
+            conn.execute("DELETE FROM recommendations WHERE created_at < ?", (now - self.ttl_seconds,))
+            conn.execute("""
+                DELETE FROM recommendations WHERE fingerprint IN (
+                    SELECT fingerprint FROM recommendations ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                )
+            """, (self.max_entries,))
+
+    def stats(self) -> Dict:
+        """Return hit, miss and entry counts along with the hit rate"""
+        with self._connect() as conn:
+            counts = dict(conn.execute("SELECT name, value FROM stats").fetchall())
+            entries = conn.execute("SELECT COUNT(*) FROM recommendations").fetchone()[0]
+
+        lookups = counts['hits'] + counts['misses']
+        return {
+            'hits': counts['hits'],
+            'misses': counts['misses'],
+            'entries': entries,
+            'hit_rate': counts['hits'] / lookups if lookups else 0.0
+        }
+
+
+# Sentinel recording that the default cache could not be opened, so it is only attempted once
+_UNAVAILABLE = object()
+_default_cache = None
+
+
+def get_default_cache() -> Optional[RecommendationCache]:
+    """Return the shared cache, creating it on first use; None if it cannot be opened"""
+    global _default_cache
+    if _default_cache is None:
+        try:
+            _default_cache = RecommendationCache()
+        except (OSError, sqlite3.Error) as e:
+            print(f"Recommendation cache unavailable, continuing without it: {str(e)}")
+            _default_cache = _UNAVAILABLE
+    return None if _default_cache is _UNAVAILABLE else _default_cache
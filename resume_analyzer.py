@@ -1,16 +1,44 @@
 import re
+import sqlite3
 from typing import Dict, List, Optional
 import requests # type: ignore
 
-from ai import get_ai_response # type: ignore
+from ai import AI_MODEL, get_ai_response # type: ignore
+from recommendation_cache import RecommendationCache, get_default_cache
+
+RECOMMENDATION_PROMPT = """Analyze this resume and provide specific recommendations for ATS optimization:
+
+Resume Analysis:
+- Current ATS Score: {total_score}/100
+- Sections present: {sections_found}
+- Missing sections: {sections_missing}
+- Keywords found: {keywords_found}
+- Missing important keywords: {keywords_missing}
+- Contact information: {contact}
+- Length: {estimated_pages} pages
+
+Please provide specific recommendations for improving this resume's ATS compatibility."""
 
 class ResumeAnalyzer:
-    def __init__(self, text, sections, keywords):
+    def __init__(self, text, sections, keywords, recommendation_cache: Optional[RecommendationCache] = None,
+                 cache_recommendations: bool = True):
         self.text = text
         self.standard_sections = sections
         self.keywords = self._initialize_keywords(keywords)
+        # Without an explicit cache the shared default is used; cache_recommendations=False disables caching
+        self._recommendation_cache = recommendation_cache
+        self.cache_recommendations = cache_recommendations
         self.api_url = "https://api.textcort¬ex.com/v1/texts/completions"
 
+    @property
+    def recommendation_cache(self) -> Optional[RecommendationCache]:
+        """Recommendation cache, opened on first use; None if disabled or unavailable"""
+        if not self.cache_recommendations:
+            return None
+        if self._recommendation_cache is None:
+            self._recommendation_cache = get_default_cache()
+        return self._recommendation_cache
+
     def _initialize_keywords(self, keywords: List[str]) -> Dict[str, float]:
         """Convert keywords list to dictionary with weights"""
         keyword_weights = {
@@ -202,27 +230,39 @@ class ResumeAnalyzer:
         """Generate AI-powered recommendations using the free model API"""
         try:
             analysis_results = self.analyze()
-            sections_missing = list(set(self.standard_sections) - set(analysis_results['sections_found']))
-            keywords_missing = list(set(self.keywords) - set(analysis_results['keywords_found']))
+            prompt_inputs = self._get_prompt_inputs(analysis_results)
 
             # Construct a prompt for the AI
-            prompt = f"""Analyze this resume and provide specific recommendations for ATS optimization:
-
-Resume Analysis:
-- Current ATS Score: {analysis_results['total_score']}/100
-- Sections present: {analysis_results['sections_found']}
-- Missing sections: {sections_missing}
-- Keywords found: {analysis_results['keywords_found']}
-- Missing important keywords: {keywords_missing}
-- Contact information: {"Complete" if all(analysis_results['contact_info'].values()) else "Incomplete"}
-- Length: {analysis_results['estimated_pages']} pages
-
-Please provide specific recommendations for improving this resume's ATS compatibility."""
+            prompt = RECOMMENDATION_PROMPT.format(
+                contact="Complete" if prompt_inputs['contact_complete'] else "Incomplete",
+                **prompt_inputs
+            )
+
+            # Identical prompt inputs produce identical prompts, so reuse earlier answers.
+            # The template and model are part of the key so changing either invalidates old answers.
+            fingerprint = RecommendationCache.fingerprint({
+                'model': AI_MODEL,
+                'prompt_template': RECOMMENDATION_PROMPT,
+                **prompt_inputs
+            })
+            cache = self.recommendation_cache
+            if cache is not None:
+                try:
+                    cached = cache.get(fingerprint)
+                    if cached is not None:
+                        return cached
+                except sqlite3.Error as e:
+                    print(f"Recommendation cache lookup failed: {str(e)}")
 
             response = get_ai_response(prompt)
 
             if response["status_code"] == 200:
                 print("API response received")
+                if cache is not None:
+                    try:
+                        cache.set(fingerprint, response["content"])
+                    except sqlite3.Error as e:
+                        print(f"Recommendation cache write failed: {str(e)}")
                 return response["content"]
             else:
                 print("No response from the API")
@@ -232,6 +272,19 @@ Please provide specific recommendations for improving this resume's ATS compatib
             print(f"Error generating AI recommendations: {str(e)}")
             return self._get_fallback_recommendations(analysis_results)
 
+    def _get_prompt_inputs(self, analysis_results):
+        """Build the canonical facts the recommendation prompt is made from"""
+        return {
+            'total_score': analysis_results['total_score'],
+            'sections_found': sorted(analysis_results['sections_found']),
+            'sections_missing': sorted(set(self.standard_sections) - set(analysis_results['sections_found'])),
+            'keywords_found': sorted(analysis_results['keywords_found']),
+            'keywords_missing': sorted(set(self.keywords) - set(analysis_results['keywords_found'])),
+            'contact_complete': all(analysis_results['contact_info'].values()),
+            # Bucket to the nearest half page so small length differences share a prompt
+            'estimated_pages': round(analysis_results['estimated_pages'] * 2) / 2
+        }
+
     def _get_fallback_recommendations(self, analysis_results):
         """Generate basic recommendations based on analysis results"""
         recommendations = []
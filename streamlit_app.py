@@ -1,9 +1,10 @@
 import streamlit as st # type: ignore
 import os
+import sqlite3
 from ai import get_ai_response
 from parse_job_description import parse_job_description
 from resume_analyzer import ResumeAnalyzer
-from text_extractor import PDFTextExtractor
+from text_extractor import PDFPreflightInspector, PDFTextExtractor
 from utils import load_default_keywords, load_default_sections
 import tempfile
 from seo_handler import handle_seo_routes
@@ -66,6 +67,22 @@ def analyze_resume(job_description, uploaded_file):
                     st.markdown(f"{job_description['content']}")
                 pdf_bytes = uploaded_file.getvalue()
                 pdf_file = BytesIO(pdf_bytes)
+
+                # Reject scanned resumes before running full layout extraction.
+                # Mixed documents still have enough text to analyse, so they take the full
+                # extraction path with a warning that their scanned pages are not read.
+                # The pre-flight is only a fast path, so any failure defers to the extractor.
+                try:
+                    classification = PDFPreflightInspector().inspect(pdf_file)['classification']
+                except Exception as e:
+                    print(f"PDF pre-flight inspection failed: {str(e)}")
+                    classification = PDFPreflightInspector.UNKNOWN
+                if classification == PDFPreflightInspector.IMAGE_ONLY:
+                    st.error("The uploaded PDF appears to be image-based or contains very little text. Please upload a text-based PDF.")
+                    return
+                if classification == PDFPreflightInspector.MIXED:
+                    st.warning("Some pages of the uploaded PDF appear to be scanned images. Text on those pages will not be analysed.")
+
                 extractor = PDFTextExtractor()
                 extracted_text = extractor.extract_text(pdf_file)
 
@@ -131,6 +148,15 @@ def analyze_resume(job_description, uploaded_file):
                     print(recommendations)
                     st.markdown(recommendations)
 
+                # Cache statistics cover all visitors, so they are only shown to operators who opt in
+                if os.getenv('SHOW_RECOMMENDATION_CACHE_STATS') and analyzer.recommendation_cache is not None:
+                    try:
+                        cache_stats = analyzer.recommendation_cache.stats()
+                        st.caption(f"Recommendation cache hit rate: {cache_stats['hit_rate']:.0%} "
+                                   f"({cache_stats['hits']}/{cache_stats['hits'] + cache_stats['misses']})")
+                    except sqlite3.Error as e:
+                        print(f"Recommendation cache stats unavailable: {str(e)}")
+
                 # Add social sharing buttons
                 st.markdown("""
                     ### 📱 Share this tool
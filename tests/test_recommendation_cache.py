@@ -0,0 +1,148 @@
+import sqlite3
+
+import pytest
+
+import recommendation_cache
+import resume_analyzer
+from recommendation_cache import RecommendationCache
+from resume_analyzer import ResumeAnalyzer
+
+RESUME_TEXT = "Education\nSkills: Python SQL\nemail jane@example.com 555-123-4567\n" * 20
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable replacement for time.time inside the cache module"""
+    now = [1000.0]
+    monkeypatch.setattr(recommendation_cache.time, 'time', lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return RecommendationCache(str(tmp_path / 'cache' / 'recommendations.sqlite3'), max_entries=2, ttl_seconds=60)
+
+
+def test_get_returns_value_after_set(cache):
+    assert cache.get('a') is None
+
+    cache.set('a', 'recommendation')
+
+    assert cache.get('a') == 'recommendation'
+
+
+def test_entries_expire_after_ttl(cache, clock):
+    cache.set('a', 'recommendation')
+
+    clock[0] += 61
+
+    assert cache.get('a') is None
+    assert cache.stats()['entries'] == 0
+
+
+def test_least_recently_used_entry_is_evicted(cache, clock):
+    cache.set('a', '1')
+    clock[0] += 1
+    cache.set('b', '2')
+    clock[0] += 1
+    cache.get('a')
+    clock[0] += 1
+
+    cache.set('c', '3')
+
+    assert cache.get('a') == '1'
+    assert cache.get('b') is None
+    assert cache.get('c') == '3'
+
+
+def test_stats_report_hit_rate(cache):
+    assert cache.stats()['hit_rate'] == 0.0
+
+    cache.set('a', 'recommendation')
+    cache.get('a')
+    cache.get('a')
+    cache.get('b')
+
+    stats = cache.stats()
+    assert stats['hits'] == 2
+    assert stats['misses'] == 1
+    assert stats['entries'] == 1
+    assert stats['hit_rate'] == pytest.approx(2 / 3)
+
+
+def test_fingerprint_ignores_key_order():
+    assert RecommendationCache.fingerprint({'a': 1, 'b': 2}) == RecommendationCache.fingerprint({'b': 2, 'a': 1})
+
+
+def _model_response(calls):
+    def get_ai_response(prompt):
+        calls.append(prompt)
+        return {"status_code": 200, "content": "Add Java experience"}
+    return get_ai_response
+
+
+class FailingCache(RecommendationCache):
+    def __init__(self):
+        pass
+
+    def get(self, fingerprint):
+        raise sqlite3.OperationalError("database is locked")
+
+    def set(self, fingerprint, content):
+        raise sqlite3.OperationalError("database is locked")
+
+
+def _analyzer(cache):
+    return ResumeAnalyzer(RESUME_TEXT, ["Education", "Skills"], ["Python", "SQL", "Java"], recommendation_cache=cache)
+
+
+def test_identical_analyses_call_the_model_once(cache, monkeypatch):
+    calls = []
+    monkeypatch.setattr(resume_analyzer, 'get_ai_response', _model_response(calls))
+
+    assert _analyzer(cache).get_ai_recommendations() == "Add Java experience"
+    assert _analyzer(cache).get_ai_recommendations() == "Add Java experience"
+    assert len(calls) == 1
+
+
+def test_cache_errors_keep_the_model_response(monkeypatch):
+    calls = []
+    monkeypatch.setattr(resume_analyzer, 'get_ai_response', _model_response(calls))
+
+    assert _analyzer(FailingCache()).get_ai_recommendations() == "Add Java experience"
+    assert len(calls) == 1
+
+
+def test_unavailable_cache_returns_model_response_and_is_not_retried(tmp_path, monkeypatch):
+    opens = []
+
+    def read_only_makedirs(*args, **kwargs):
+        opens.append(args)
+        raise OSError("Read-only file system")
+
+    calls = []
+    monkeypatch.setattr(recommendation_cache, '_default_cache', None)
+    monkeypatch.setenv('RECOMMENDATION_CACHE_PATH', str(tmp_path / 'cache' / 'recommendations.sqlite3'))
+    monkeypatch.setattr(recommendation_cache.os, 'makedirs', read_only_makedirs)
+    monkeypatch.setattr(resume_analyzer, 'get_ai_response', _model_response(calls))
+
+    for _ in range(2):
+        analyzer = ResumeAnalyzer(RESUME_TEXT, ["Education"], ["Python"])
+        assert analyzer.get_ai_recommendations() == "Add Java experience"
+        assert analyzer.recommendation_cache is None
+
+    assert len(calls) == 2
+    assert len(opens) == 1
+
+
+def test_caching_can_be_disabled(cache, monkeypatch):
+    calls = []
+    monkeypatch.setattr(resume_analyzer, 'get_ai_response', _model_response(calls))
+
+    for _ in range(2):
+        analyzer = ResumeAnalyzer(RESUME_TEXT, ["Education"], ["Python"], recommendation_cache=cache,
+                                  cache_recommendations=False)
+        assert analyzer.get_ai_recommendations() == "Add Java experience"
+
+    assert len(calls) == 2
+    assert cache.stats()['entries'] == 0
@@ -0,0 +1,125 @@
+import time
+from io import BytesIO
+
+import pytest
+
+from text_extractor import PDFPreflightInspector, PDFTextExtractor
+
+FONT = b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"
+IMAGE = (b"<< /Type /XObject /Subtype /Image /Width 1 /Height 1 /ColorSpace /DeviceGray "
+         b"/BitsPerComponent 8 /Length 1 >>\nstream\n\x00\nendstream")
+TEXT_CONTENT = (b"BT /F1 12 Tf 72 700 Td (Jane Doe, MBA, BI Developer) Tj "
+                b"0 -14 Td (Phone \\(555\\) 123-4567, Seattle (WA) jane@example.com) Tj ET")
+IMAGE_CONTENT = b"q 612 0 0 792 0 0 cm /Im0 Do Q"
+
+
+def _stream(data):
+    return b"<< /Length %d >>\nstream\n" % len(data) + data + b"\nendstream"
+
+
+def _build_pdf(pages, extra_objects=()):
+    """
+    Build a minimal PDF. Objects 3 and 4 are a Helvetica font and a 1x1 image,
+    extra objects follow from 5 and each page is a (content, resources) pair.
+    """
+    objects = [None, None, FONT, IMAGE] + list(extra_objects)
+    kids = []
+    for content, resources in pages:
+        page_number = len(objects) + 1
+        kids.append(b"%d 0 R" % page_number)
+        objects.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Resources " + resources
+                       + b" /Contents %d 0 R >>" % (page_number + 1))
+        objects.append(_stream(content))
+    objects[0] = b"<< /Type /Catalog /Pages 2 0 R >>"
+    objects[1] = b"<< /Type /Pages /Kids [" + b" ".join(kids) + b"] /Count %d >>" % len(kids)
+
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF" % (len(objects) + 1, xref)
+    return BytesIO(out)
+
+
+TEXT_PAGE = (TEXT_CONTENT, b"<< /Font << /F1 3 0 R >> >>")
+IMAGE_PAGE = (IMAGE_CONTENT, b"<< /XObject << /Im0 4 0 R >> >>")
+
+
+def test_text_page_is_text():
+    result = PDFPreflightInspector().inspect(_build_pdf([TEXT_PAGE]))
+
+    assert result['classification'] == PDFPreflightInspector.TEXT
+    page = result['pages'][0]
+    assert page['font_count'] == 1
+    # Escaped and nested parentheses count as shown characters
+    assert page['text_chars'] == 27 + 51
+    # "BI" inside a string literal is not an inline image
+    assert page['image_coverage'] == 0
+
+
+def test_text_page_with_small_logo_is_text():
+    content = TEXT_CONTENT + b" q 60 0 0 60 500 700 cm /Im0 Do Q"
+    resources = b"<< /Font << /F1 3 0 R >> /XObject << /Im0 4 0 R >> >>"
+
+    result = PDFPreflightInspector().inspect(_build_pdf([(content, resources)]))
+
+    assert result['classification'] == PDFPreflightInspector.TEXT
+    assert 0 < result['pages'][0]['image_coverage'] < 0.01
+
+
+def test_image_page_is_image_only():
+    result = PDFPreflightInspector().inspect(_build_pdf([IMAGE_PAGE]))
+
+    assert result['classification'] == PDFPreflightInspector.IMAGE_ONLY
+    assert result['pages'][0]['image_coverage'] == 1.0
+
+
+def test_scans_with_watermark_text_are_image_only():
+    content = IMAGE_CONTENT + b" BT /F1 6 Tf 540 10 Td (CamScanner) Tj ET"
+    resources = b"<< /Font << /F1 3 0 R >> /XObject << /Im0 4 0 R >> >>"
+
+    result = PDFPreflightInspector().inspect(_build_pdf([(content, resources)] * 2))
+
+    assert result['classification'] == PDFPreflightInspector.IMAGE_ONLY
+    assert all(page['has_text'] and page['image_dominant'] for page in result['pages'])
+
+
+def test_text_and_image_pages_are_mixed():
+    result = PDFPreflightInspector().inspect(_build_pdf([TEXT_PAGE, IMAGE_PAGE]))
+
+    assert result['classification'] == PDFPreflightInspector.MIXED
+    assert result['text_pages'] == 1
+    assert result['image_pages'] == 1
+
+
+def test_text_in_form_xobject_is_text():
+    form = (b"<< /Type /XObject /Subtype /Form /BBox [0 0 612 792] /Resources << /Font << /F1 3 0 R >> >> "
+            b"/Length %d >>\nstream\n" % len(TEXT_CONTENT) + TEXT_CONTENT + b"\nendstream")
+    pdf_file = _build_pdf([(b"q /Fm0 Do Q", b"<< /XObject << /Fm0 5 0 R >> >>")], [form])
+
+    result = PDFPreflightInspector().inspect(pdf_file)
+
+    assert result['classification'] == PDFPreflightInspector.TEXT
+    assert result['pages'][0]['font_count'] == 1
+    assert "Jane Doe" in PDFTextExtractor().extract_text(pdf_file)
+
+
+@pytest.mark.timing
+def test_inspect_is_faster_than_extraction():
+    line = b"72 -14 Td (Developed and implemented Python services on AWS with Docker) Tj "
+    content = b"BT /F1 10 Tf 0 780 Td " + line * 50 + b"ET"
+    pdf_file = _build_pdf([(content, TEXT_PAGE[1])] * 20)
+
+    start = time.perf_counter()
+    PDFPreflightInspector().inspect(pdf_file)
+    inspect_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    PDFTextExtractor().extract_text(pdf_file)
+    extract_time = time.perf_counter() - start
+
+    assert inspect_time < extract_time / 5
@@ -1,5 +1,11 @@
+import re
 import pdfplumber # type: ignore
 from io import BytesIO
+from typing import Dict, List
+from pdfminer.pdfparser import PDFParser # type: ignore
+from pdfminer.pdfdocument import PDFDocument # type: ignore
+from pdfminer.pdfpage import PDFPage # type: ignore
+from pdfminer.pdftypes import PDFStream, resolve1 # type: ignore
 
 class PDFTextExtractor:
     def extract_text(self, pdf_file: BytesIO) -> str:
@@ -30,4 +36,193 @@ class PDFTextExtractor:
             return text.strip()
         
         except Exception as e:
-            raise pdfplumber.exceptions.PDFSyntaxError(f"Error extracting text with pdfplumber: {str(e)}")
\ No newline at end of file
+            raise pdfplumber.exceptions.PDFSyntaxError(f"Error extracting text with pdfplumber: {str(e)}")
+
+
+class PDFPreflightInspector:
+    """
+    Classifies a PDF as text, image-only or mixed without running layout
+    analysis. Only the page resources and raw content streams are read.
+    """
+
+    TEXT = "text"
+    IMAGE_ONLY = "image-only"
+    MIXED = "mixed"
+    UNKNOWN = "unknown"
+
+    # Pages with at least this share of their area under images and fewer shown
+    # characters than MIN_TEXT_CHARS are treated as scans, so scanner watermarks,
+    # page numbers and OCR headers do not make a page count as text
+    IMAGE_PAGE_COVERAGE = 0.5
+    # Matches the minimum extracted text length analyze_resume accepts
+    MIN_TEXT_CHARS = 50
+
+    # These are lexical heuristics over the raw content stream, not a full content
+    # parser. String literals and inline image data are measured and then blanked
+    # out so their bytes cannot be mistaken for operators. Only the scale of the
+    # transformation matrix (its determinant) is tracked through q/Q and cm, which
+    # is enough to size images but ignores clipping and overlap.
+    _INLINE_IMAGE_DATA = re.compile(rb"\bBI\b.*?\bID\s.*?\bEI\b", re.DOTALL)
+    _STRING_LITERAL = re.compile(rb"\((?:\\.|[^\\()])*\)", re.DOTALL)
+    _HEX_STRING = re.compile(rb"<([0-9A-Fa-f\s]*)>")
+    _ESCAPE = re.compile(rb"\\(?:[0-7]{1,3}|.)", re.DOTALL)
+    # Text-showing operators (Tj, TJ, ' and ") following a string or array operand
+    _TEXT_OPERATOR = re.compile(rb"[)\]>]\s*(?:Tj|TJ|'|\")")
+    # Graphics state save/restore, matrix concatenation, XObject invocation and inline images
+    _NUMBER = rb"([-+]?(?:\d+\.?\d*|\.\d+))"
+    _GRAPHICS_OPERATOR = re.compile(
+        rb"(?<![/\w])([qQ])(?!\w)"
+        rb"|" + rb"\s+".join([_NUMBER] * 4) + rb"\s+[-+.\d]+\s+[-+.\d]+\s+cm\b"
+        rb"|/([^\s/\[\]()<>{}%]+)\s+Do\b"
+        rb"|\bBI\b"
+    )
+    # Guards against deeply nested or self-referencing Form XObjects
+    _MAX_FORM_DEPTH = 8
+
+    def inspect(self, pdf_file: BytesIO) -> Dict:
+        """
+        Inspects the shown text, font resources and image coverage of each page.
+
+        A document is image-only when its text pages show fewer than
+        MIN_TEXT_CHARS characters in total, mixed when some pages are scans,
+        and text otherwise.
+
+        Args:
+            pdf_file (BytesIO): A BytesIO object containing the PDF data.
+
+        Returns:
+            Dict: The document 'classification' and per-page 'pages' details.
+        """
+        pdf_file.seek(0)
+        document = PDFDocument(PDFParser(pdf_file))
+
+        pages = [self._inspect_page(page) for page in PDFPage.create_pages(document)]
+        pdf_file.seek(0)
+
+        text_chars = sum(page['text_chars'] for page in pages if page['has_text'])
+        text_pages = sum(1 for page in pages if page['has_text'] and not page['image_dominant'])
+        image_pages = sum(1 for page in pages if page['image_dominant'])
+
+        if text_pages == 0 or text_chars < self.MIN_TEXT_CHARS:
+            classification = self.IMAGE_ONLY
+        elif image_pages == 0:
+            classification = self.TEXT
+        else:
+            classification = self.MIXED
+
+        return {
+            'classification': classification,
+            'page_count': len(pages),
+            'text_pages': text_pages,
+            'image_pages': image_pages,
+            'text_chars': text_chars,
+            'pages': pages
+        }
+
+    def _inspect_page(self, page: PDFPage) -> Dict:
+        """Collect shown text, font and image coverage details for a single page"""
+        resources = resolve1(page.resources) or {}
+        content = b"\n".join(self._get_content_streams(page))
+
+        details = {'text_operators': 0, 'text_chars': 0, 'font_count': 0, 'image_area': 0.0}
+        self._scan_content(content, resources, details, scale=1.0, visited=frozenset(), depth=0)
+
+        x0, y0, x1, y1 = page.mediabox
+        page_area = abs((x1 - x0) * (y1 - y0)) or 1
+        image_coverage = min(1.0, details['image_area'] / page_area)
+        # Shown strings need a font to be extractable, so both signals are required
+        has_text = details['text_operators'] > 0 and details['font_count'] > 0
+        text_chars = details['text_chars'] if has_text else 0
+
+        return {
+            'has_text': has_text,
+            'text_operators': details['text_operators'],
+            'text_chars': text_chars,
+            'font_count': details['font_count'],
+            'image_coverage': image_coverage,
+            'image_dominant': image_coverage >= self.IMAGE_PAGE_COVERAGE and text_chars < self.MIN_TEXT_CHARS
+        }
+
+    def _scan_content(self, content: bytes, resources: Dict, details: Dict, scale: float,
+                      visited: frozenset, depth: int) -> None:
+        """Accumulate details for a content stream and the Form XObjects it draws"""
+        content = self._INLINE_IMAGE_DATA.sub(b"BI EI", content)
+        content, details['text_chars'] = self._blank_strings(content, details['text_chars'])
+
+        fonts = resolve1(resources.get('Font')) or {}
+        xobjects = self._get_xobjects(resources)
+
+        details['text_operators'] += len(self._TEXT_OPERATOR.findall(content))
+        details['font_count'] += len(fonts)
+
+        # Images are drawn into the unit square, so their area is the matrix determinant
+        stack = []
+        for match in self._GRAPHICS_OPERATOR.finditer(content):
+            operator, name = match.group(1), match.group(6)
+            if operator == b"q":
+                stack.append(scale)
+            elif operator == b"Q":
+                scale = stack.pop() if stack else scale
+            elif match.group(2) is not None:
+                a, b, c, d = (float(match.group(i)) for i in range(2, 6))
+                scale *= abs(a * d - b * c)
+            elif name is None:
+                details['image_area'] += scale
+            else:
+                xobject = xobjects.get(name.decode('latin-1'))
+                subtype = self._subtype(xobject)
+                key = getattr(xobject, 'objid', None) or id(xobject)
+                if subtype == 'Image':
+                    details['image_area'] += scale
+                elif subtype == 'Form' and key not in visited and depth < self._MAX_FORM_DEPTH:
+                    # Form XObjects carry their own content and usually their own resources
+                    form_resources = resolve1(xobject.get('Resources')) or resources
+                    form_scale = scale * self._matrix_scale(resolve1(xobject.get('Matrix')))
+                    self._scan_content(xobject.get_data(), form_resources, details, form_scale,
+                                       visited | {key}, depth + 1)
+
+    def _blank_strings(self, content: bytes, text_chars: int):
+        """Blank out string operands, adding an estimate of the characters they show to text_chars"""
+        # Nested parentheses are balanced, so blank innermost strings until none remain
+        replaced = 1
+        while replaced:
+            for match in self._STRING_LITERAL.finditer(content):
+                text_chars += len(self._ESCAPE.sub(b"_", match.group(0)[1:-1]))
+            content, replaced = self._STRING_LITERAL.subn(b"<>", content)
+        for match in self._HEX_STRING.finditer(content):
+            text_chars += len(re.sub(rb"\s", b"", match.group(1))) // 2
+        return self._HEX_STRING.sub(b"<>", content), text_chars
+
+    def _matrix_scale(self, matrix) -> float:
+        """Return the area scale of a PDF matrix, defaulting to the identity"""
+        try:
+            a, b, c, d = (float(resolve1(value)) for value in matrix[:4])
+        except (TypeError, ValueError):
+            return 1.0
+        return abs(a * d - b * c)
+
+    def _get_content_streams(self, page: PDFPage) -> List[bytes]:
+        """Return the decoded content streams of a page"""
+        streams = []
+        for stream in page.contents or []:
+            stream = resolve1(stream)
+            if isinstance(stream, PDFStream):
+                streams.append(stream.get_data())
+        return streams
+
+    def _get_xobjects(self, resources: Dict) -> Dict[str, PDFStream]:
+        """Resolve the XObjects of a resource dictionary by name"""
+        xobjects = resolve1(resources.get('XObject')) or {}
+        resolved = {}
+        for name, xobject in xobjects.items():
+            xobject = resolve1(xobject)
+            if isinstance(xobject, PDFStream):
+                resolved[name] = xobject
+        return resolved
+
+    def _subtype(self, xobject) -> str:
+        """Return the XObject subtype name, e.g. 'Image' or 'Form'"""
+        if xobject is None:
+            return ""
+        subtype = resolve1(xobject.get('Subtype'))
+        return getattr(subtype, 'name', str(subtype))